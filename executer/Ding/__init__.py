@@ -9,6 +9,7 @@ from thirdparty_data_sdk.dingding.dingsdk.constants import TOKEN_FROM_APPKEY_APP
 from thirdparty_data_sdk.dingding.dingsdk.user_manager import UserManager
 from thirdparty_data_sdk.dingding.dingsdk.department_manager import DepartmentManager
 from thirdparty_data_sdk.dingding.dingsdk.role_manager import RoleManager
+from thirdparty_data_sdk.dingding.dingsdk.request_manager import RequestManager
 from oneid_meta.models import User, DeptMember, Dept, Group, DingConfig
 
 DEFAULT_DEPT = '1'
@@ -29,9 +30,10 @@ class DingExecuter(Executer):
             self.token_manager = AccessTokenManager(ding_config.app_key, ding_config.app_secret,
                                                     TOKEN_FROM_APPKEY_APPSECRET)
 
-        self.user_manager = UserManager(self.token_manager)
-        self.dept_manager = DepartmentManager(self.token_manager)
-        self.role_manager = RoleManager(self.token_manager)
+        self.request_manager = RequestManager()
+        self.user_manager = UserManager(self.token_manager, self.request_manager)
+        self.dept_manager = DepartmentManager(self.token_manager, self.request_manager)
+        self.role_manager = RoleManager(self.token_manager, self.request_manager)
 
     def create_user(self, user_info):
         """
@@ -8,6 +8,7 @@ from thirdparty_data_sdk.dingding.dingsdk.department_manager import DepartmentMa
 from thirdparty_data_sdk.dingding.dingsdk.accesstoken_manager import AccessTokenManager
 from thirdparty_data_sdk.dingding.dingsdk.user_manager import UserManager
 from thirdparty_data_sdk.dingding.dingsdk.role_manager import RoleManager
+from thirdparty_data_sdk.dingding.dingsdk.request_manager import RequestManager
 from executer.core import cli_factory
 from oneid_meta.models.user import User, DingUser
 from oneid_meta.models.group import Group, GroupMember
@@ -250,13 +251,14 @@ def entrypoint():
     '''
     ding_config = DingConfig.get_current()
     token_manager = AccessTokenManager(ding_config.app_key, ding_config.app_secret, DINGDING_APP_VERSION)
-    department_manager = DepartmentManager(token_manager)
-    user_manager = UserManager(token_manager)
-    role_manager = RoleManager(token_manager)
     db_executer = cli_factory(EXECUTERS)(User.objects.get(username='admin'))
     root_dep = Dept.objects.get(uid=DEPARTMENT_ROOT_UID)
-    build_department_user_rawdata(db_executer, user_manager, department_manager, DEPARTMENT_ROOT_ID, root_dep)
-    build_group_rawdata(db_executer, role_manager)
+    with RequestManager() as request_manager:
+        department_manager = DepartmentManager(token_manager, request_manager)
+        user_manager = UserManager(token_manager, request_manager)
+        role_manager = RoleManager(token_manager, request_manager)
+        build_department_user_rawdata(db_executer, user_manager, department_manager, DEPARTMENT_ROOT_ID, root_dep)
+        build_group_rawdata(db_executer, role_manager)
 
 
 if __name__ == '__main__':
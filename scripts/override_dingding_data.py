@@ -6,6 +6,7 @@ import json
 from thirdparty_data_sdk.dingding.dingsdk.department_manager import DepartmentManager
 from thirdparty_data_sdk.dingding.dingsdk.accesstoken_manager import AccessTokenManager
 from thirdparty_data_sdk.dingding.dingsdk.user_manager import UserManager
+from thirdparty_data_sdk.dingding.dingsdk.request_manager import RequestManager
 from oneid_meta.models.user import User, DingUser
 from oneid_meta.models.group import Group, DingGroup
 from oneid_meta.models.dept import Dept, DingDept
@@ -188,12 +189,13 @@ def entrypoint():
     '''
     ding_config = DingConfig.get_current()
     token_manager = AccessTokenManager(ding_config.app_key, ding_config.app_secret, DINGDING_APP_VERSION)
-    department_manager = DepartmentManager(token_manager)
-    user_manager = UserManager(token_manager)
+    with RequestManager() as request_manager:
+        department_manager = DepartmentManager(token_manager, request_manager)
+        user_manager = UserManager(token_manager, request_manager)
 
-    override_ding_dept(department_manager)
-    override_ding_role(department_manager)
-    override_ding_user(user_manager)
+        override_ding_dept(department_manager)
+        override_ding_role(department_manager)
+        override_ding_user(user_manager)
 
 
 if __name__ == '__main__':
@@ -11,14 +11,15 @@ class MessageManager():
     Role Manage class, init with AccessTokenManager instance
     """
 
-    def __init__(self, token_manager, agent_id):
+    def __init__(self, token_manager, agent_id, request_manager=None):
         """
         init the MessageManager
         :param AccessTokenManager token_manager: instance of AccessTokenManager
         :param agent_id: Number 企业自建应用是微应用agentId
+        :param RequestManager request_manager: 可选，与其他manager共用的RequestManager
         """
         self.token_manager = token_manager
-        self.request_manager = RequestManager()
+        self.request_manager = request_manager or RequestManager()
         self.agent_id = agent_id
 
     def asyncsend_text_message(self,
@@ -3,6 +3,8 @@ Manage request get, post and raise exception when api call failed
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from thirdparty_data_sdk.dingding.dingsdk.error_utils import APICallError
 
 
@@ -13,6 +15,24 @@ class RequestManager:
 
     def __init__(self):
         self.request_count = 0
+        # 钉钉接口均在同一域名下，复用连接以避免每次请求重新握手
+        # 删除类接口使用GET，只重试建立连接，不重试读取，避免重复提交
+        self.session = requests.Session()
+        adapter = HTTPAdapter(max_retries=Retry(total=3, connect=3, read=0, backoff_factor=0.2))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def close(self):
+        """
+        关闭连接池
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
     def get(self, request_url=None, request_params=None):
         """
@@ -24,7 +44,7 @@ class RequestManager:
 
         self.request_count += 1
 
-        res = requests.get(url=request_url, params=request_params)
+        res = self.session.get(url=request_url, params=request_params)
 
         tmp_json = res.json()
         if tmp_json['errcode'] != 0:
@@ -44,7 +64,7 @@ class RequestManager:
 
         self.request_count += 1
 
-        res = requests.post(
+        res = self.session.post(
             url=request_url,
             params=request_params,
             json=request_data,
@@ -11,13 +11,14 @@ class RoleManager():
     Role Manage class, init with AccessTokenManager instance
     """
 
-    def __init__(self, token_manager):
+    def __init__(self, token_manager, request_manager=None):
         """
         init the RoleManager
         :param AccessTokenManager token_manager: instance of AccessTokenManager
+        :param RequestManager request_manager: 可选，与其他manager共用的RequestManager
         """
         self.token_manager = token_manager
-        self.request_manager = RequestManager()
+        self.request_manager = request_manager or RequestManager()
 
     def get_roles_list(self, size, offset):
         """
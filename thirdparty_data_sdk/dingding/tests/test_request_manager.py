@@ -0,0 +1,68 @@
+"""
+Test Dingding request manager class
+"""
+# pylint: disable=missing-docstring
+
+import unittest
+from unittest import mock
+from thirdparty_data_sdk.dingding.dingsdk.request_manager import RequestManager
+from thirdparty_data_sdk.dingding.dingsdk.error_utils import APICallError
+
+TEST_URL = 'https://oapi.dingtalk.com/test'
+TEST_PARAMS = {'access_token': 'test_token'}
+TEST_DATA = {'name': 'test'}
+
+
+class TestRequestManager(unittest.TestCase):
+    def setUp(self):
+        self.session_patcher = mock.patch(
+            'thirdparty_data_sdk.dingding.dingsdk.request_manager.requests.Session')
+        self.mock_session_cls = self.session_patcher.start()
+        self.mock_session = self.mock_session_cls.return_value
+        self.request_manager = RequestManager()
+
+    def tearDown(self):
+        self.session_patcher.stop()
+
+    def test_init(self):
+        self.mock_session_cls.assert_called_once_with()
+        self.assertIs(self.mock_session, self.request_manager.session)
+        mounted = [args[0] for args, _ in self.mock_session.mount.call_args_list]
+        self.assertIn('https://', mounted)
+
+    def test_get(self):
+        self.mock_session.get.return_value.json.return_value = {'errcode': 0, 'errmsg': 'ok'}
+        self.assertEqual({'errcode': 0, 'errmsg': 'ok'},
+                         self.request_manager.get(request_url=TEST_URL, request_params=TEST_PARAMS))
+        self.request_manager.get(request_url=TEST_URL, request_params=TEST_PARAMS)
+        self.assertEqual(2, self.mock_session.get.call_count)
+        self.mock_session.get.assert_called_with(url=TEST_URL, params=TEST_PARAMS)
+        self.assertEqual(2, self.request_manager.request_count)
+
+    def test_post(self):
+        self.mock_session.post.return_value.json.return_value = {'errcode': 0, 'errmsg': 'ok'}
+        self.assertEqual({'errcode': 0, 'errmsg': 'ok'},
+                         self.request_manager.post(request_url=TEST_URL,
+                                                   request_params=TEST_PARAMS,
+                                                   request_data=TEST_DATA))
+        self.mock_session.post.assert_called_once_with(url=TEST_URL, params=TEST_PARAMS, json=TEST_DATA)
+
+    def test_get_error(self):
+        self.mock_session.get.return_value.json.return_value = {'errcode': 60121, 'errmsg': 'not found'}
+        with self.assertRaises(APICallError):
+            self.request_manager.get(request_url=TEST_URL, request_params=TEST_PARAMS)
+
+    def test_post_error(self):
+        self.mock_session.post.return_value.json.return_value = {'errcode': 40014, 'errmsg': 'invalid token'}
+        with self.assertRaises(APICallError):
+            self.request_manager.post(request_url=TEST_URL, request_params=TEST_PARAMS, request_data=TEST_DATA)
+
+    def test_context_manager(self):
+        with RequestManager() as request_manager:
+            self.assertIsInstance(request_manager, RequestManager)
+            self.mock_session.close.assert_not_called()
+        self.mock_session.close.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()